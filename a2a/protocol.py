@@ -9,12 +9,27 @@ import hmac
 import json
 import time
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # Optional speedup for outbound message bodies
+    orjson = None  # type: ignore[assignment]
+
+
+def encode_body(data: Dict[str, Any]) -> bytes:
+    """Serialize an outbound A2A body, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles them
+    return json.dumps(data).encode("utf-8")
+
 
 class MessageType(Enum):
     """Standard A2A message types"""
@@ -32,7 +47,7 @@ class MessageType(Enum):
     COORDINATION_MESSAGE = "coordination_message"
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AMessage:
     """Standard A2A message format"""
 
@@ -47,9 +62,19 @@ class A2AMessage:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data["message_type"] = self.message_type.value
-        return data
+        # Payloads are already JSON-safe (signing runs json.dumps on them), so skip the deep
+        # copy asdict() would make. The payload dict itself is copied so callers editing the
+        # returned body cannot change the signed message; nested values are still shared.
+        return {
+            "message_id": self.message_id,
+            "message_type": self.message_type.value,
+            "sender_id": self.sender_id,
+            "recipient_id": self.recipient_id,
+            "timestamp": self.timestamp,
+            "payload": dict(self.payload),
+            "signature": self.signature,
+            "correlation_id": self.correlation_id,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "A2AMessage":
@@ -96,6 +121,10 @@ class A2AProtocol:
         self.endpoint = endpoint
         self.secret_key = secret_key or "default_a2a_key"
 
+        # Keyed HMAC state, copied per message instead of re-deriving the key pads each time
+        self._hmac_key = self.secret_key
+        self._hmac_template = self._new_hmac(self.secret_key)
+
         # Agent registry for discovered agents
         self.known_agents: Dict[str, AgentProfile] = {}
 
@@ -128,6 +157,11 @@ class A2AProtocol:
 
         return message
 
+    @staticmethod
+    def _new_hmac(secret_key: str) -> "hmac.HMAC":
+        """Create the keyed HMAC template that message signatures are copied from"""
+        return hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
     def _sign_message(self, message: A2AMessage) -> str:
         """Create HMAC signature for message authentication"""
         # Create signature payload (exclude signature field)
@@ -141,11 +175,14 @@ class A2AProtocol:
         }
 
         message_bytes = json.dumps(sign_data, sort_keys=True).encode("utf-8")
-        signature = hmac.new(
-            self.secret_key.encode("utf-8"), message_bytes, hashlib.sha256
-        ).hexdigest()
 
-        return signature
+        if self._hmac_key != self.secret_key:  # secret_key was reassigned
+            self._hmac_template = self._new_hmac(self.secret_key)
+            self._hmac_key = self.secret_key
+
+        mac = self._hmac_template.copy()
+        mac.update(message_bytes)
+        return mac.hexdigest()
 
     def verify_message(self, message: A2AMessage) -> bool:
         """Verify message signature"""
@@ -177,7 +214,7 @@ class A2AProtocol:
             # Send HTTP POST to agent's A2A endpoint
             response = requests.post(
                 f"{recipient_endpoint}/a2a",
-                json=message.to_dict(),
+                data=encode_body(message.to_dict()),
                 headers={
                     "Content-Type": "application/json",
                     "X-A2A-Protocol": "1.0",
@@ -216,7 +253,10 @@ class A2AProtocol:
         for endpoint in broadcast_endpoints:
             try:
                 response = requests.post(
-                    f"{endpoint}/a2a", json=discovery_message.to_dict(), timeout=5.0
+                    f"{endpoint}/a2a",
+                    data=encode_body(discovery_message.to_dict()),
+                    headers={"Content-Type": "application/json"},
+                    timeout=5.0,
                 )
 
                 if response.status_code == 200:
@@ -5,7 +5,9 @@ MainAgent with Agent-to-Agent protocol integration for standardized communicatio
 """
 
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -182,6 +184,7 @@ class MainAgentA2A:
                 "primary_role": "data_specialist",
             },
         }
+        self._rebuild_routing_index(self._routing_fingerprint())
 
         # MCP server endpoint for direct fallback
         self.mcp_url = f"http://localhost:{os.getenv('MCP_SERVER_PORT', '8000')}/mcp"
@@ -197,31 +200,100 @@ class MainAgentA2A:
 
         return {agent.agent_id: agent for agent in discovered_agents}
 
-    def determine_best_agent_a2a(self, query: str) -> tuple[str, float]:
-        """Determine best agent using A2A capability matching"""
-        query_lower = query.lower().strip()
-        best_agent = None
-        best_confidence = 0.0
+    def _routing_fingerprint(self) -> tuple:
+        """Snapshot of the agent_specializations fields that routing depends on"""
+        return tuple(
+            [
+                (agent_id, tuple(spec["keywords"]), spec["confidence_threshold"])
+                for agent_id, spec in self.agent_specializations.items()
+            ]
+        )
+
+    def _rebuild_routing_index(self, fingerprint: tuple):
+        """Recompile routing tables from agent_specializations and drop cached routes"""
+        keyword_table = self._compile_keyword_table()
+        self._route_normalized = self._compile_router(
+            keyword_table, self._compile_keyword_prefilter(keyword_table)
+        )
+        self._compiled_fingerprint = fingerprint
+
+    @staticmethod
+    def _keyword_confidence(keyword_matches: int, keyword_count: int) -> float:
+        """Confidence for an agent given how many of its keywords a query contains"""
+        confidence = min(keyword_matches / keyword_count, 1.0)
+
+        # Boost confidence for primary role match
+        if confidence > 0:
+            confidence = min(confidence * 1.2, 1.0)
+
+        return confidence
+
+    def _compile_keyword_table(self) -> tuple:
+        """Flatten agent specializations into routing rows.
 
+        Each row is (agent_id, keywords, threshold, confidences), where confidences[n] is the
+        confidence for a query containing n of the agent's keywords.
+        """
+        table = []
         for agent_id, spec in self.agent_specializations.items():
-            # Calculate confidence based on keyword matching
-            keyword_matches = sum(1 for keyword in spec["keywords"] if keyword in query_lower)
-            confidence = min(keyword_matches / len(spec["keywords"]), 1.0)
+            keywords = tuple(spec["keywords"])
+            confidences = tuple(
+                self._keyword_confidence(matches, len(keywords))
+                for matches in range(len(keywords) + 1)
+            )
+            table.append((agent_id, keywords, spec["confidence_threshold"], confidences))
+        return tuple(table)
+
+    @staticmethod
+    def _compile_keyword_prefilter(keyword_table: tuple) -> re.Pattern:
+        """Single pattern matching any routing keyword, to skip scoring queries that hit none"""
+        keywords = {
+            keyword for _, agent_keywords, _, _ in keyword_table for keyword in agent_keywords
+        }
+        return re.compile("|".join(map(re.escape, sorted(keywords))))
+
+    @staticmethod
+    def _compile_router(keyword_table: tuple, keyword_prefilter: re.Pattern):
+        """Build a cached router over one compiled keyword table.
+
+        Routing only depends on the normalized query, so repeated queries are answered from
+        the cache. The closure holds the table rather than the agent, so the cache does not
+        keep the instance alive.
+        """
+
+        @lru_cache(maxsize=1024)
+        def route(query_lower: str) -> tuple[str, float]:
+            best_agent = None
+            best_confidence = 0.0
 
-            # Boost confidence for primary role match
-            if confidence > 0:
-                confidence = min(confidence * 1.2, 1.0)
+            # Queries without any keyword score zero everywhere and fall through to the default
+            rows = keyword_table if keyword_prefilter.search(query_lower) else ()
 
-            if confidence > best_confidence and confidence >= spec["confidence_threshold"]:
-                best_agent = agent_id
-                best_confidence = confidence
+            for agent_id, keywords, threshold, confidences in rows:
+                # Confidence from keyword matching (substring containment, counted in C)
+                confidence = confidences[sum(map(query_lower.__contains__, keywords))]
 
-        # Default to greeting agent for low-confidence queries (better UX)
-        if not best_agent or best_confidence < 0.3:
-            best_agent = "greeting_agent"
-            best_confidence = 0.5
+                if confidence > best_confidence and confidence >= threshold:
+                    best_agent = agent_id
+                    best_confidence = confidence
 
-        return best_agent, best_confidence
+            # Default to greeting agent for low-confidence queries (better UX)
+            if not best_agent or best_confidence < 0.3:
+                best_agent = "greeting_agent"
+                best_confidence = 0.5
+
+            return best_agent, best_confidence
+
+        return route
+
+    def determine_best_agent_a2a(self, query: str) -> tuple[str, float]:
+        """Determine best agent using A2A capability matching"""
+        # Rebuild the routing tables (and drop cached routes) whenever the specializations
+        # have been reassigned or edited in place since they were compiled
+        fingerprint = self._routing_fingerprint()
+        if fingerprint != self._compiled_fingerprint:
+            self._rebuild_routing_index(fingerprint)
+        return self._route_normalized(query.lower().strip())
 
     def delegate_with_a2a(self, agent_id: str, query: str) -> Dict[str, Any]:
         """Delegate task using A2A protocol"""
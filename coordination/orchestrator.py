@@ -5,9 +5,11 @@ Advanced coordination engine for complex multi-agent workflows
 """
 
 import asyncio
+import heapq
 import os
 import sys
 import time
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -17,7 +19,7 @@ from typing import Any, Dict, List, Optional
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from a2a.protocol import A2AMessage, A2AProtocol, AgentCapability, MessageType
+from a2a.protocol import A2AMessage, A2AProtocol, AgentCapability, MessageType, encode_body
 
 
 class TaskStatus(Enum):
@@ -43,7 +45,7 @@ class CoordinationPattern(Enum):
     COLLABORATIVE = "collaborative"  # Agents work together on shared task
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskNode:
     """Individual task in a coordination workflow"""
 
@@ -55,8 +57,8 @@ class TaskNode:
     status: TaskStatus = TaskStatus.PENDING
     result: Optional[Any] = None
     error: Optional[str] = None
-    start_time: Optional[float] = None
-    end_time: Optional[float] = None
+    start_time: Optional[int] = None  # time.perf_counter_ns()
+    end_time: Optional[int] = None  # time.perf_counter_ns()
     retry_count: int = 0
     max_retries: int = 3
     timeout: float = 60.0
@@ -110,6 +112,9 @@ class MultiAgentOrchestrator:
         # Agent capabilities cache
         self.agent_capabilities: Dict[str, List[AgentCapability]] = {}
 
+        # Upper bound on tasks in flight at once for the parallel pattern
+        self.max_parallel_tasks = int(os.getenv("ORCHESTRATOR_MAX_PARALLEL", "32"))
+
         # Coordination patterns
         self.coordination_handlers = {
             CoordinationPattern.SEQUENTIAL: self._execute_sequential,
@@ -135,7 +140,7 @@ class MultiAgentOrchestrator:
             f"Tasks: {len(tasks)} tasks across {len(set(task.agent_id for task in tasks))} agents"
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         context = context or {}
 
         # Initialize workflow tracking
@@ -146,7 +151,7 @@ class MultiAgentOrchestrator:
             handler = self.coordination_handlers[pattern]
             results = await handler(workflow_id, tasks, context)
 
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             # Create workflow result
             workflow_result = WorkflowResult(
@@ -166,7 +171,7 @@ class MultiAgentOrchestrator:
             return workflow_result
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             error_result = WorkflowResult(
                 workflow_id=workflow_id,
                 status=TaskStatus.FAILED,
@@ -213,13 +218,24 @@ class MultiAgentOrchestrator:
         for task in tasks:
             task.input_data.update({"context": context})
 
-        # Execute all tasks concurrently
-        task_coroutines = [self._execute_single_task(task) for task in tasks]
-        task_results = await asyncio.gather(*task_coroutines, return_exceptions=True)
+        # Execute tasks concurrently, at most max_parallel_tasks at a time
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_tasks))
+
+        async def run_task(task: TaskNode) -> Any:
+            async with semaphore:
+                try:
+                    return await self._execute_single_task(task)
+                except Exception as e:
+                    # A failing task is recorded without cancelling its siblings
+                    return e
+
+        async with asyncio.TaskGroup() as task_group:
+            handles = [(task, task_group.create_task(run_task(task))) for task in tasks]
 
         # Collect results
         results = {}
-        for task, result in zip(tasks, task_results):
+        for task, handle in handles:
+            result = handle.result()
             if isinstance(result, Exception):
                 task.status = TaskStatus.FAILED
                 task.error = str(result)
@@ -264,19 +280,24 @@ class MultiAgentOrchestrator:
     ) -> Dict[str, Any]:
         """Execute tasks in hierarchical tree structure based on dependencies"""
         results = {}
-        completed_tasks = set()
 
-        # Build dependency graph
-        task_map = {task.task_id: task for task in tasks}
+        # Build dependency graph (Kahn's algorithm): count unmet dependencies per task and
+        # record which tasks each task unblocks. Dependencies on unknown task ids are never
+        # met, so those tasks are reported as unresolvable below.
+        task_index = {task.task_id: i for i, task in enumerate(tasks)}
+        unmet = [len(task.dependencies) for task in tasks]
+        dependents: List[List[int]] = [[] for _ in tasks]
+        for i, task in enumerate(tasks):
+            for dep in task.dependencies:
+                if dep in task_index:
+                    dependents[task_index[dep]].append(i)
+
+        ready = [i for i, count in enumerate(unmet) if count == 0]
+        completed = 0
 
-        while len(completed_tasks) < len(tasks):
-            # Find tasks ready to execute (dependencies met)
-            ready_tasks = []
-            for task in tasks:
-                if task.task_id not in completed_tasks and all(
-                    dep in completed_tasks for dep in task.dependencies
-                ):
-                    ready_tasks.append(task)
+        while completed < len(tasks):
+            # Tasks whose dependencies are all met, in workflow order
+            ready_tasks = [tasks[i] for i in sorted(ready)]
 
             if not ready_tasks:
                 raise Exception("Circular dependency or unresolvable dependencies detected")
@@ -301,7 +322,16 @@ class MultiAgentOrchestrator:
                     results[task.task_id] = {"error": str(result)}
                 else:
                     results[task.task_id] = result
-                completed_tasks.add(task.task_id)
+
+            # Completed tasks (failed or not) unblock their dependents for the next wave
+            completed += len(ready_tasks)
+            next_ready = []
+            for i in ready:
+                for dependent in dependents[i]:
+                    unmet[dependent] -= 1
+                    if unmet[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = next_ready
 
         return results
 
@@ -353,7 +383,9 @@ class MultiAgentOrchestrator:
                 agent_results[task.agent_id] = {
                     "result": result,
                     "execution_time": (
-                        task.end_time - task.start_time if task.end_time and task.start_time else 0
+                        (task.end_time - task.start_time) / 1e9
+                        if task.end_time and task.start_time
+                        else 0
                     ),
                     "quality_score": self._evaluate_result_quality(result),
                 }
@@ -415,7 +447,7 @@ class MultiAgentOrchestrator:
 
     async def _execute_single_task(self, task: TaskNode) -> Any:
         """Execute a single task on a specific agent"""
-        task.start_time = time.time()
+        task.start_time = time.perf_counter_ns()
         task.status = TaskStatus.RUNNING
 
         try:
@@ -445,7 +477,7 @@ class MultiAgentOrchestrator:
             ):
                 task.status = TaskStatus.COMPLETED
                 task.result = response.get("payload", {}).get("result")
-                task.end_time = time.time()
+                task.end_time = time.perf_counter_ns()
                 return task.result
             else:
                 error_msg = response.get("payload", {}).get("error") or response.get(
@@ -456,7 +488,7 @@ class MultiAgentOrchestrator:
         except Exception as e:
             task.status = TaskStatus.FAILED
             task.error = str(e)
-            task.end_time = time.time()
+            task.end_time = time.perf_counter_ns()
 
             # Retry logic
             if task.retry_count < task.max_retries:
@@ -477,7 +509,7 @@ class MultiAgentOrchestrator:
             async with aiohttp.ClientSession() as session:
                 async with session.post(
                     f"{endpoint}/a2a",
-                    json=message.to_dict(),
+                    data=encode_body(message.to_dict()),
                     headers={"Content-Type": "application/json"},
                     timeout=aiohttp.ClientTimeout(total=30),
                 ) as response:
@@ -491,38 +523,30 @@ class MultiAgentOrchestrator:
         if not agent_responses:
             return None
 
-        # For text responses, find most common
-        response_counts = {}
-        for agent_id, response in agent_responses.items():
-            response_str = str(response)
-            response_counts[response_str] = response_counts.get(response_str, 0) + 1
+        # Compare responses by their text form; ties go to the first response seen
+        if len(agent_responses) == 1:
+            return str(next(iter(agent_responses.values())))
 
-        # Return most frequent response
-        if response_counts:
-            consensus = max(response_counts.items(), key=lambda x: x[1])[0]
-            return consensus
-
-        return list(agent_responses.values())[0]
+        return Counter(map(str, agent_responses.values())).most_common(1)[0][0]
 
     def _determine_winner(self, agent_results: Dict[str, Dict[str, Any]]) -> Optional[str]:
         """Determine winner in competitive execution"""
         if not agent_results:
             return None
 
-        # Score based on quality and speed
-        best_score = -1
-        winner = None
+        return self._top_k_winners(agent_results, 1)[0]
+
+    def _top_k_winners(self, agent_results: Dict[str, Dict[str, Any]], k: int = 1) -> List[str]:
+        """Return the k best agents in competitive execution, best first (ties keep input order)"""
 
-        for agent_id, data in agent_results.items():
+        def total_score(agent_id: str) -> float:
+            # Score based on quality and speed
+            data = agent_results[agent_id]
             quality = data.get("quality_score", 0)
             speed_bonus = max(0, 10 - data.get("execution_time", 10))  # Bonus for speed
-            total_score = quality + (speed_bonus * 0.1)
-
-            if total_score > best_score:
-                best_score = total_score
-                winner = agent_id
+            return quality + (speed_bonus * 0.1)
 
-        return winner
+        return heapq.nlargest(k, agent_results, key=total_score)
 
     def _evaluate_result_quality(self, result: Any) -> float:
         """Evaluate quality of a result (0-10 scale)"""
@@ -581,7 +605,7 @@ class MultiAgentOrchestrator:
         workflow = self.active_workflows.get(workflow_id, {})
 
         task_times = [
-            task.end_time - task.start_time
+            (task.end_time - task.start_time) / 1e9
             for task in workflow.values()
             if task.start_time and task.end_time
         ]
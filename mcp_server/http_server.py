@@ -35,6 +35,16 @@ class MCPResponse(BaseModel):
     result: Any
     error: Optional[str] = None
 
+    @classmethod
+    def ok(cls, result: Any) -> "MCPResponse":
+        """Successful response; skips validation since result comes from our own tools"""
+        return cls.model_construct(result=result, error=None)
+
+    @classmethod
+    def err(cls, error: str) -> "MCPResponse":
+        """Error response; skips validation since error is a message we built"""
+        return cls.model_construct(result=None, error=error)
+
 
 # Health check endpoint
 @app.get("/health")
@@ -109,10 +119,10 @@ async def mcp_endpoint(request: MCPRequest):
         else:
             raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
 
-        return MCPResponse(result=result)
+        return MCPResponse.ok(result)
 
     except Exception as e:
-        return MCPResponse(result=None, error=str(e))
+        return MCPResponse.err(str(e))
 
 
 # Root endpoint with server info
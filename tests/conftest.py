@@ -9,54 +9,60 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-# Add project root to Python path (prepend to avoid collision with installed packages like 'a2a-sdk')
+# Add project root to Python path (prepend to avoid collision with installed packages like 'a2a-sdk').
+# Test modules rely on this instead of mutating sys.path themselves; the guard keeps repeated
+# conftest imports (xdist workers, pytester) from stacking duplicate entries.
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from a2a.protocol import A2AProtocol
-from agents.greeting_agent_a2a import GreetingAgentA2A
-from agents.hr_agent_a2a import HRAgentA2A
 
-# Import commonly used classes for fixtures
-from agents.main_agent_a2a import MainAgentA2A
-from coordination.orchestrator import MultiAgentOrchestrator
-
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when available, else on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture
 def main_agent():
     """Fixture for MainAgentA2A instance"""
+    from agents.main_agent_a2a import MainAgentA2A
+
     return MainAgentA2A()
 
 
 @pytest.fixture
 def hr_agent():
     """Fixture for HRAgentA2A instance"""
+    from agents.hr_agent_a2a import HRAgentA2A
+
     return HRAgentA2A()
 
 
 @pytest.fixture
 def greeting_agent():
     """Fixture for GreetingAgentA2A instance"""
+    from agents.greeting_agent_a2a import GreetingAgentA2A
+
     return GreetingAgentA2A()
 
 
 @pytest.fixture
 def orchestrator():
     """Fixture for MultiAgentOrchestrator instance"""
+    from coordination.orchestrator import MultiAgentOrchestrator
+
     return MultiAgentOrchestrator()
 
 
 @pytest.fixture
 def test_a2a_protocol():
     """Fixture for A2A protocol instance for testing"""
+    from a2a.protocol import A2AProtocol
+
     return A2AProtocol(
         agent_id="test_agent",
         agent_name="TestAgent",
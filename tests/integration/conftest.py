@@ -0,0 +1,12 @@
+"""
+Collection settings for the integration test suite
+"""
+
+import os
+
+# The legacy /a2a/v1 JSON-RPC suite is ignored at collection time so its module
+# is never imported. It is kept for reference only: RUN_LEGACY_A2A=1 collects it,
+# but the routes it targets are gone and its tests are marked xfail
+collect_ignore_glob = []
+if os.getenv("RUN_LEGACY_A2A") != "1":
+    collect_ignore_glob.append("test_jsonrpc_endpoints.py")
@@ -4,17 +4,11 @@ A2A Protocol Integration Tests
 Testing Agent-to-Agent communication protocol integration
 """
 
-import sys
 import time
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
-
 from a2a.protocol import A2AMessage, A2AProtocol, MessageType
 from agents.greeting_agent_a2a import GreetingAgentA2A
 from agents.hr_agent_a2a import HRAgentA2A
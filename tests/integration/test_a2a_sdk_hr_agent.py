@@ -11,9 +11,8 @@ from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
 
-# Add project root to Python path
+# Project root (put on sys.path by tests/conftest.py), hidden while the SDK is imported
 project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
 
 from agents.hr_agent_a2a import HRAgentA2A
 
@@ -12,9 +12,8 @@ from typing import Any, Dict, Optional
 import pytest
 from fastapi.testclient import TestClient
 
-# Add project root to Python path
+# Project root (put on sys.path by tests/conftest.py), hidden while the SDK is imported
 project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
 
 from agents.main_agent_a2a import MainAgentA2A
 
@@ -1,50 +1,39 @@
 #!/usr/bin/env python3
 """
 DEPRECATED: Legacy JSON-RPC integration tests for /a2a/v1 methods.
-This file is retained for historical reference but is skipped by default
-since the project now uses the official A2A SDK at /a2a.
+This file is retained for historical reference only and is not collected by default
+since the project now uses the official A2A SDK at /a2a. The /a2a/v1 routes no longer
+exist, so with RUN_LEGACY_A2A=1 (see tests/integration/conftest.py) every test is
+collected but expected to fail.
 """
 
-import pytest
-
-pytestmark = pytest.mark.skip(reason="Legacy /a2a/v1 tests removed; SDK /a2a is default")
-
-import sys
-from pathlib import Path
+import json
+from types import MappingProxyType
 
 import pytest
-from fastapi.testclient import TestClient
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
+pytestmark = pytest.mark.xfail(reason="Legacy /a2a/v1 routes removed; SDK /a2a is default")
 
-from agents.greeting_agent_a2a import GreetingAgentA2A  # noqa: F401
-from agents.hr_agent_a2a import HRAgentA2A  # noqa: F401
-from agents.main_agent_a2a import MainAgentA2A  # noqa: F401
+# Apps are built once per module against the legacy/spec-aligned JSON-RPC
+# implementation (USE_A2A_SDK=false); see the client fixtures below
+AGENT_CLIENTS = ["hr_client", "greeting_client", "main_client"]
 
+JSON_HEADERS = {"content-type": "application/json"}
 
-# Ensure baseline tests run against legacy/spec-aligned JSON-RPC implementation, not SDK
-@pytest.fixture(autouse=True)
-def disable_a2a_sdk(monkeypatch):
-    monkeypatch.setenv("USE_A2A_SDK", "false")
 
+def _encode(payload):
+    """Serialize a static JSON-RPC request once, at import time"""
+    return json.dumps(payload).encode("utf-8")
 
-@pytest.mark.parametrize(
-    "agent_cls, host, port",
-    [
-        (HRAgentA2A, "localhost", 18002),
-        (GreetingAgentA2A, "localhost", 18003),
-        (MainAgentA2A, "localhost", 18001),
-    ],
-)
-def test_message_send_blocking(agent_cls, host, port):
-    agent = agent_cls()
-    app = agent.build_app(host, port)
-    client = TestClient(app)
 
-    # Blocking = true should return a Message from agent
-    req = {
+# Frozen envelopes for requests whose params carry a server-assigned task id.
+# json.dumps cannot serialize a MappingProxyType, so call sites unpack them.
+TASKS_GET = MappingProxyType({"jsonrpc": "2.0", "id": "3", "method": "tasks/get"})
+TASKS_CANCEL = MappingProxyType({"jsonrpc": "2.0", "id": "5", "method": "tasks/cancel"})
+
+# Blocking = true should return a Message from agent
+SEND_BLOCKING = _encode(
+    {
         "jsonrpc": "2.0",
         "id": "1",
         "method": "message/send",
@@ -57,31 +46,11 @@ def test_message_send_blocking(agent_cls, host, port):
             "configuration": {"blocking": True},
         },
     }
-    resp = client.post("/a2a/v1", json=req)
-    assert resp.status_code == 200
-    data = resp.json()
-    assert data.get("result"), data
-    result = data["result"]
-    # For blocking path, we expect a message shape (role/parts/messageId)
-    assert result.get("role") == "agent"
-    assert isinstance(result.get("parts"), list) and result["parts"], result
-
-
-@pytest.mark.parametrize(
-    "agent_cls, host, port",
-    [
-        (HRAgentA2A, "localhost", 18002),
-        (GreetingAgentA2A, "localhost", 18003),
-        (MainAgentA2A, "localhost", 18001),
-    ],
 )
-def test_message_send_nonblocking_and_tasks_get(agent_cls, host, port):
-    agent = agent_cls()
-    app = agent.build_app(host, port)
-    client = TestClient(app)
 
-    # Non-blocking should create a Task
-    req = {
+# Non-blocking should create a Task
+SEND_NONBLOCKING = _encode(
+    {
         "jsonrpc": "2.0",
         "id": "2",
         "method": "message/send",
@@ -94,19 +63,90 @@ def test_message_send_nonblocking_and_tasks_get(agent_cls, host, port):
             "configuration": {"blocking": False},
         },
     }
-    resp = client.post("/a2a/v1", json=req)
+)
+
+SEND_CANCELABLE = _encode(
+    {
+        "jsonrpc": "2.0",
+        "id": "4",
+        "method": "message/send",
+        "params": {
+            "message": {
+                "role": "user",
+                "parts": [{"kind": "text", "text": "list all employees"}],
+            },
+            "configuration": {"blocking": False},
+        },
+    }
+)
+
+
+def _build_legacy_client(agent_cls, host: str, port: int):
+    """Build an (agent, TestClient) pair against the legacy, non-SDK routes.
+
+    USE_A2A_SDK is only read while the app is being built, so it is set for
+    the duration of build_app rather than for every test in the module.
+    """
+    from fastapi.testclient import TestClient
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("USE_A2A_SDK", "false")
+        agent = agent_cls()
+        client = TestClient(agent.build_app(host, port))
+    return agent, client
+
+
+@pytest.fixture(scope="module")
+def hr_client():
+    """Module-wide (HRAgentA2A, TestClient) pair for the legacy app"""
+    from agents.hr_agent_a2a import HRAgentA2A
+
+    return _build_legacy_client(HRAgentA2A, "localhost", 18002)
+
+
+@pytest.fixture(scope="module")
+def greeting_client():
+    """Module-wide (GreetingAgentA2A, TestClient) pair for the legacy app"""
+    from agents.greeting_agent_a2a import GreetingAgentA2A
+
+    return _build_legacy_client(GreetingAgentA2A, "localhost", 18003)
+
+
+@pytest.fixture(scope="module")
+def main_client():
+    """Module-wide (MainAgentA2A, TestClient) pair for the legacy app"""
+    from agents.main_agent_a2a import MainAgentA2A
+
+    return _build_legacy_client(MainAgentA2A, "localhost", 18001)
+
+
+@pytest.mark.parametrize("client_fixture", AGENT_CLIENTS)
+def test_message_send_blocking(request, client_fixture):
+    _, client = request.getfixturevalue(client_fixture)
+
+    resp = client.post("/a2a/v1", content=SEND_BLOCKING, headers=JSON_HEADERS)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data.get("result"), data
+    result = data["result"]
+    # For blocking path, we expect a message shape (role/parts/messageId)
+    assert result.get("role") == "agent"
+    assert isinstance(result.get("parts"), list) and result["parts"], result
+
+
+@pytest.mark.parametrize("client_fixture", AGENT_CLIENTS)
+def test_message_send_nonblocking_and_tasks_get(request, client_fixture):
+    _, client = request.getfixturevalue(client_fixture)
+
+    resp = client.post("/a2a/v1", content=SEND_NONBLOCKING, headers=JSON_HEADERS)
     assert resp.status_code == 200
     result = resp.json()["result"]
     assert result.get("kind") == "task", result
     task_id = result["id"]
 
-    # tasks/get with historyLength
-    get_req = {
-        "jsonrpc": "2.0",
-        "id": "3",
-        "method": "tasks/get",
-        "params": {"id": task_id, "historyLength": 1},
-    }
+    # tasks/get with historyLength. This cannot share a JSON-RPC batch with the
+    # send above: its params need the task id the server assigns in that reply
+    get_req = {**TASKS_GET, "params": {"id": task_id, "historyLength": 1}}
     get_resp = client.post("/a2a/v1", json=get_req)
     assert get_resp.status_code == 200
     task = get_resp.json()["result"]
@@ -115,38 +155,18 @@ def test_message_send_nonblocking_and_tasks_get(agent_cls, host, port):
     assert len(task["history"]) <= 1
 
 
-@pytest.mark.parametrize(
-    "agent_cls, host, port",
-    [
-        (HRAgentA2A, "localhost", 18002),
-        (GreetingAgentA2A, "localhost", 18003),
-        (MainAgentA2A, "localhost", 18001),
-    ],
-)
-def test_tasks_cancel_noncancelable(agent_cls, host, port):
-    agent = agent_cls()
-    app = agent.build_app(host, port)
-    client = TestClient(app)
+@pytest.mark.parametrize("client_fixture", AGENT_CLIENTS)
+def test_tasks_cancel_noncancelable(request, client_fixture):
+    _, client = request.getfixturevalue(client_fixture)
 
     # Create non-blocking task
-    send_req = {
-        "jsonrpc": "2.0",
-        "id": "4",
-        "method": "message/send",
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"kind": "text", "text": "list all employees"}],
-            },
-            "configuration": {"blocking": False},
-        },
-    }
-    send_resp = client.post("/a2a/v1", json=send_req)
+    send_resp = client.post("/a2a/v1", content=SEND_CANCELABLE, headers=JSON_HEADERS)
     assert send_resp.status_code == 200
     task_id = send_resp.json()["result"]["id"]
 
-    # Cancel task (first cancel should succeed)
-    cancel_req = {"jsonrpc": "2.0", "id": "5", "method": "tasks/cancel", "params": {"id": task_id}}
+    # Cancel task (first cancel should succeed); like tasks/get it depends on the
+    # server-assigned task id, so it stays a separate roundtrip rather than a batch
+    cancel_req = {**TASKS_CANCEL, "params": {"id": task_id}}
     cancel_resp = client.post("/a2a/v1", json=cancel_req)
     assert cancel_resp.status_code == 200
     canceled = cancel_resp.json()["result"]
@@ -159,11 +179,9 @@ def test_tasks_cancel_noncancelable(agent_cls, host, port):
     assert err.get("code") == -32002  # TASK_NOT_CANCELABLE
 
 
-def test_agent_card_shapes():
+def test_agent_card_shapes(hr_client):
     # Only test HR agent for shape; others share same schema shape
-    agent = HRAgentA2A()
-    app = agent.build_app("localhost", 18002)
-    client = TestClient(app)
+    agent, client = hr_client
 
     resp = client.get("/.well-known/agent-card.json")
     assert resp.status_code == 200
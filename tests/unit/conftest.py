@@ -0,0 +1,64 @@
+"""
+Shared fixtures for the unit test suite
+"""
+
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+
+# These override the function-scoped agent fixtures of the same name in tests/conftest.py.
+# Unit tests only read agent state (patches are undone on exit), so one instance per
+# module is enough. The orchestrator stays function-scoped because coordination tests
+# replace its methods. MainAgentA2A already caches its own routing decisions;
+# social replies pick a random template, so they are deliberately left uncached.
+
+
+@pytest.fixture(scope="module")
+def main_agent():
+    """Module-wide MainAgentA2A instance"""
+    from agents.main_agent_a2a import MainAgentA2A
+
+    return MainAgentA2A()
+
+
+@pytest.fixture(scope="module")
+def hr_agent():
+    """Module-wide HRAgentA2A instance"""
+    from agents.hr_agent_a2a import HRAgentA2A
+
+    return HRAgentA2A()
+
+
+@pytest.fixture(scope="module")
+def greeting_agent():
+    """Module-wide GreetingAgentA2A instance"""
+    from agents.greeting_agent_a2a import GreetingAgentA2A
+
+    return GreetingAgentA2A()
+
+
+@pytest.fixture(scope="session")
+def requirements_path():
+    """Path to the top-level requirements.txt"""
+    return project_root / "requirements.txt"
+
+
+@pytest.fixture(scope="session")
+def deployment_requirements_path():
+    """Path to deployment/requirements.txt"""
+    return project_root / "deployment" / "requirements.txt"
+
+
+@pytest.fixture(scope="session")
+def requirements_text(requirements_path):
+    """Lowercased contents of requirements.txt, or "" when the file is missing"""
+    return requirements_path.read_text().lower() if requirements_path.exists() else ""
+
+
+@pytest.fixture(scope="session")
+def deployment_requirements_text(deployment_requirements_path):
+    """Lowercased contents of deployment/requirements.txt, or "" when the file is missing"""
+    path = deployment_requirements_path
+    return path.read_text().lower() if path.exists() else ""
@@ -9,23 +9,195 @@ This test suite validates:
 3. RAG (Retrieval-Augmented Generation) capabilities
 4. Intelligent query processing pipeline
 5. Context-aware response generation
+
+Agent fixtures (see tests/unit/conftest.py) and the orchestrator fixture below are
+module-scoped, so running under pytest-xdist with --dist=loadscope builds them once per
+worker rather than per test.
 """
 
 import os
-import sys
-from pathlib import Path
-from unittest.mock import patch
+import re
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
 
-from agents.greeting_agent_a2a import GreetingAgentA2A
-from agents.hr_agent_a2a import HRAgentA2A
-from agents.main_agent_a2a import MainAgentA2A
-from coordination.orchestrator import MultiAgentOrchestrator
+@contextmanager
+def fast_patch(obj, attr, value):
+    """Swap an instance attribute with plain setattr for the duration of the block.
+
+    Cheaper than patch.object for the shared agent fixtures; an attribute that only
+    existed on the class is deleted again on exit rather than pinned to the instance.
+    """
+    missing = object()
+    original = vars(obj).get(attr, missing)
+    setattr(obj, attr, value)
+    try:
+        yield value
+    finally:
+        if original is missing:
+            delattr(obj, attr)
+        else:
+            setattr(obj, attr, original)
+
+
+class _McpStub:
+    """Stand-in for MCPToolWrapper that returns a canned result and records the last call"""
+
+    __slots__ = ("return_value", "called", "args", "kwargs")
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.called = False
+        self.args = ()
+        self.kwargs = {}
+
+    def call_tool(self, *args, **kwargs):
+        self.called = True
+        self.args = args
+        self.kwargs = kwargs
+        return self.return_value
+
+
+# LLM-related packages expected in requirements.txt
+LLM_INDICATORS = frozenset({"openai", "langchain", "litellm", "anthropic", "transformers"})
+
+# Case-insensitive substring checks, compiled once instead of lowercasing and
+# rescanning the response for every indicator
+_GUIDANCE_RE = re.compile(r"agent|help|try|ask|system|data", re.I)
+_GREETING_RE = re.compile(r"hello|help|assist|!|\?|greeting", re.I)
+_SEARCH_GUIDANCE_RE = re.compile(r"try|ask|help|search|find|information|employee|department", re.I)
+
+# Agent references counted individually, so they stay a set rather than an alternation
+AGENT_REFERENCES = frozenset({"hr", "mainagent", "agent", "employee", "data"})
+
+# Query types and their classification (updated for actual routing behavior)
+ROUTING_QUERIES = [
+    (
+        "employee department salary payroll hierarchy team staff manager organization",
+        "hr_agent",
+        "data_retrieval",
+    ),  # Need many keywords
+    ("Hello, how are you today?", "greeting_agent", "social_interaction"),
+    ("Thank you for your help", "greeting_agent", "gratitude"),
+    (
+        "Show me all employees",
+        "greeting_agent",
+        "organizational_data",
+    ),  # Falls back due to threshold
+    ("Who are you and what can you do?", "greeting_agent", "system_inquiry"),
+]
+
+# Confidence calculation cases (updated for actual thresholds)
+CONFIDENCE_CASES = [
+    # HR agent needs many keywords to meet 0.9 threshold
+    ("employee department salary payroll hierarchy team staff manager", "hr_agent", 0.9),
+    # Greeting agent keywords (updated for actual confidence levels)
+    ("hello how are you", "greeting_agent", 0.5),  # Falls back to 0.5 default
+    # Fallback for unclear queries
+    ("random unclear query xyz", "greeting_agent", 0.5),
+]
+
+GUIDANCE_QUERIES = ["Hello", "Help me please", "Thank you", "Who are you?"]
+
+PERSONALITY_QUERIES = ["Hello", "How are you?", "Thank you", "Who are you?"]
+
+# Detailed response for quality scoring, built once at import
+_LONG_RESPONSE = (
+    "This is a very detailed and comprehensive response with lots of information and context " * 3
+)
+
+# Responses and their minimum quality scores (updated for actual algorithm)
+QUALITY_CASES = [
+    pytest.param("", 0.0, id="empty"),
+    pytest.param("Short response", 1.0, id="short"),
+    # Structured response (reduced expectation)
+    pytest.param({"structured": "data", "with": "multiple", "fields": True}, 3.0, id="structured"),
+    # Detailed response (adjusted to match actual score)
+    pytest.param(_LONG_RESPONSE, 4.5, id="detailed"),
+]
+
+# (agent responses, acceptable consensus values)
+CONSENSUS_CASES = [
+    pytest.param(
+        {
+            "agent1": "Response A",
+            "agent2": "Response A",
+            "agent3": "Response B",
+            "agent4": "Response A",
+        },
+        ("Response A",),
+        id="majority",
+    ),
+    # Tie should pick one of the tied responses
+    pytest.param(
+        {"agent1": "Response X", "agent2": "Response Y"},
+        ("Response X", "Response Y"),
+        id="tie",
+    ),
+    pytest.param({"agent1": "Only", "agent2": "Only"}, ("Only",), id="unanimous"),
+    pytest.param({}, (None,), id="empty"),
+]
+
+# Keywords each agent's capabilities should mention, keyed by agent fixture name
+SPECIALIZATION_KEYWORDS = [
+    ("hr_agent", frozenset({"employee", "hr", "organization"})),
+    ("greeting_agent", frozenset({"greeting", "social", "help"})),
+    ("main_agent", frozenset({"coordination", "routing"})),
+]
+
+# Every query sent to the greeting agent, each processed once per module
+SOCIAL_QUERIES = tuple(dict.fromkeys(GUIDANCE_QUERIES + PERSONALITY_QUERIES))
+
+DATA_QUERIES = [
+    "List all employees",
+    "Show Engineering department",
+    # Removed "Get organizational hierarchy" as it expects different data structure
+]
+
+# (MCP result, expected type, extracted data) for _extract_data_from_mcp_result
+_EXTRACT_CASES = [
+    pytest.param(
+        {"content": [{"name": "John", "id": 1}]},
+        "list",
+        [{"name": "John", "id": 1}],
+        id="content-list",
+    ),
+    pytest.param({"error": "Database error"}, "list", None, id="error"),
+    pytest.param(
+        [{"name": "Direct", "id": 2}], "list", [{"name": "Direct", "id": 2}], id="direct-list"
+    ),
+    pytest.param({"content": {"summary": "data"}}, "dict", {"summary": "data"}, id="content-dict"),
+]
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    """Module-wide MultiAgentOrchestrator; these tests only call its scoring helpers"""
+    from coordination.orchestrator import MultiAgentOrchestrator
+
+    return MultiAgentOrchestrator()
+
+
+@pytest.fixture(scope="module")
+def capability_keywords(hr_agent, greeting_agent, main_agent):
+    """Flattened capability keywords per agent fixture, None for agents without capabilities"""
+    agents = {"hr_agent": hr_agent, "greeting_agent": greeting_agent, "main_agent": main_agent}
+    return {
+        name: (
+            frozenset(keyword for cap in agent.capabilities for keyword in cap.keywords)
+            if hasattr(agent, "capabilities")
+            else None
+        )
+        for name, agent in agents.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def social_responses(greeting_agent):
+    """Greeting agent replies keyed by query, shared by the social response tests"""
+    return {query: greeting_agent.process_social_query(query) for query in SOCIAL_QUERIES}
 
 
 class TestLLMFrameworkReadiness:
@@ -40,120 +212,77 @@ class TestLLMFrameworkReadiness:
             "A2A_SECRET_KEY": "test_secret_key",
         }
 
-        for var_name, test_value in test_vars.items():
-            # Test environment variable can be set and retrieved
-            with patch.dict(os.environ, {var_name: test_value}):
+        # Test environment variables can be set and retrieved (one snapshot for all of them)
+        with patch.dict(os.environ, test_vars):
+            for var_name, test_value in test_vars.items():
                 assert os.getenv(var_name) == test_value
 
-    def test_requirements_file_llm_dependencies(self):
+    def test_requirements_file_llm_dependencies(self, requirements_text):
         """Test that requirements.txt includes LLM-related dependencies"""
-        requirements_path = project_root / "requirements.txt"
-
-        if requirements_path.exists():
-            with open(requirements_path, "r") as f:
-                requirements_content = f.read()
+        if requirements_text:
+            # At least some LLM framework should be mentioned (even if commented out)
+            assert any(
+                indicator in requirements_text for indicator in LLM_INDICATORS
+            ), "No LLM framework references found in requirements.txt"
 
-            # Check for LLM-related packages (even if commented out)
-            llm_indicators = ["openai", "langchain", "litellm", "anthropic", "transformers"]
-
-            # At least some LLM framework should be mentioned
-            found_llm_refs = sum(
-                1 for indicator in llm_indicators if indicator in requirements_content.lower()
-            )
-            assert found_llm_refs > 0, "No LLM framework references found in requirements.txt"
-
-    def test_deployment_requirements_llm_preparation(self):
+    def test_deployment_requirements_llm_preparation(self, deployment_requirements_text):
         """Test deployment requirements include LLM framework preparation"""
-        deployment_req_path = project_root / "deployment" / "requirements.txt"
-
-        if deployment_req_path.exists():
-            with open(deployment_req_path, "r") as f:
-                content = f.read()
-
+        if deployment_requirements_text:
             # Should include langchain for LLM framework
             assert (
-                "langchain" in content.lower()
+                "langchain" in deployment_requirements_text
             ), "LangChain framework not found in deployment requirements"
 
 
 class TestIntelligentQueryProcessing:
     """Test intelligent query processing and context-aware responses"""
 
-    def test_query_analysis_and_classification(self):
+    @pytest.mark.parametrize("query,expected_agent,query_type", ROUTING_QUERIES)
+    def test_query_analysis_and_classification(self, main_agent, query, expected_agent, query_type):
         """Test query analysis and intelligent classification"""
-        main_agent = MainAgentA2A()
-
-        # Test different query types and their classification (updated for actual routing behavior)
-        test_queries = [
-            (
-                "employee department salary payroll hierarchy team staff manager organization",
-                "hr_agent",
-                "data_retrieval",
-            ),  # Need many keywords
-            ("Hello, how are you today?", "greeting_agent", "social_interaction"),
-            ("Thank you for your help", "greeting_agent", "gratitude"),
-            (
-                "Show me all employees",
-                "greeting_agent",
-                "organizational_data",
-            ),  # Falls back due to threshold
-            ("Who are you and what can you do?", "greeting_agent", "system_inquiry"),
-        ]
-
-        for query, expected_agent, query_type in test_queries:
-            best_agent, confidence = main_agent.determine_best_agent_a2a(query)
-
-            # Validate intelligent routing
-            assert (
-                best_agent == expected_agent
-            ), f"Query '{query}' should route to {expected_agent}, got {best_agent}"
-            assert confidence > 0.0, f"Query '{query}' should have positive confidence"
+        best_agent, confidence = main_agent.determine_best_agent_a2a(query)
 
-            # Validate confidence is reasonable for the query type
-            if query_type == "data_retrieval" and expected_agent == "hr_agent":
-                assert confidence >= 0.9, f"Data retrieval query should have high confidence"
-            elif query_type == "social_interaction":
-                assert confidence >= 0.5, f"Social interaction should have decent confidence"
-
-    def test_context_awareness_in_responses(self):
+        # Validate intelligent routing
+        assert (
+            best_agent == expected_agent
+        ), f"Query '{query}' should route to {expected_agent}, got {best_agent}"
+        assert confidence > 0.0, f"Query '{query}' should have positive confidence"
+
+        # Validate confidence is reasonable for the query type
+        if query_type == "data_retrieval" and expected_agent == "hr_agent":
+            assert 0.9 <= confidence <= 1.0, f"Data retrieval query should have high confidence"
+        elif query_type == "social_interaction":
+            assert 0.5 <= confidence <= 1.0, f"Social interaction should have decent confidence"
+
+    @pytest.mark.parametrize("query", GUIDANCE_QUERIES)
+    def test_context_awareness_in_responses(self, social_responses, query):
         """Test context-aware response generation"""
-        greeting_agent = GreetingAgentA2A()
-
-        # Test that responses include context and guidance
-        test_queries = ["Hello", "Help me please", "Thank you", "Who are you?"]
-
-        for query in test_queries:
-            response = greeting_agent.process_social_query(query)
+        response = social_responses[query]
 
-            # Responses should be context-aware and helpful
-            assert isinstance(response, str)
-            assert len(response) > 20  # Should be substantial responses
+        # Responses should be context-aware and helpful
+        assert isinstance(response, str)
+        assert len(response) > 20, query  # Should be substantial responses
 
-            # Should include system guidance
-            guidance_indicators = ["agent", "help", "try", "ask", "system", "data"]
-            has_guidance = any(indicator in response.lower() for indicator in guidance_indicators)
-            assert has_guidance, f"Response to '{query}' should include system guidance"
+        # Should include system guidance
+        has_guidance = bool(_GUIDANCE_RE.search(response))
+        assert has_guidance, f"Response to '{query}' should include system guidance"
 
-    def test_smart_search_functionality(self):
+    def test_smart_search_functionality(self, hr_agent):
         """Test intelligent search capabilities"""
-        hr_agent = HRAgentA2A()
-
         # Test smart search method exists and processes queries intelligently
         assert hasattr(hr_agent, "_smart_search"), "HR agent should have smart search capability"
 
         # Mock the MCP call to test search logic
-        with patch.object(hr_agent, "mcp") as mock_mcp:
-            mock_mcp.call_tool.return_value = {
-                "content": [{"id": 1, "name": "John Engineer", "department": "Engineering"}]
-            }
-
+        mcp_stub = _McpStub(
+            {"content": [{"id": 1, "name": "John Engineer", "department": "Engineering"}]}
+        )
+        with fast_patch(hr_agent, "mcp", mcp_stub):
             # Test search processes words intelligently
             result = hr_agent._smart_search("Find engineer named John")
 
             # Should have called search with meaningful terms
-            mock_mcp.call_tool.assert_called()
-            call_args = mock_mcp.call_tool.call_args
-            assert call_args[0][0] == "search_employees"  # Tool name
+            assert mcp_stub.called
+            assert mcp_stub.args[0] == "search_employees"  # Tool name
 
             # Should format results intelligently
             assert isinstance(result, str)
@@ -163,61 +292,41 @@ class TestIntelligentQueryProcessing:
 class TestRAGCapabilities:
     """Test Retrieval-Augmented Generation infrastructure"""
 
-    def test_data_retrieval_integration(self):
+    @pytest.mark.parametrize("query", DATA_QUERIES)
+    def test_data_retrieval_integration(self, hr_agent, query):
         """Test data retrieval integration for RAG"""
-        hr_agent = HRAgentA2A()
-
-        # Test that agent can process queries requiring data retrieval
-        data_queries = [
-            "List all employees",
-            "Show Engineering department",
-            # Removed "Get organizational hierarchy" as it expects different data structure
-        ]
+        # Mock MCP response
+        mcp_stub = _McpStub({"content": [{"sample": "data"}]})
 
-        for query in data_queries:
-            # Mock MCP response
-            with patch.object(hr_agent, "mcp") as mock_mcp:
-                mock_mcp.call_tool.return_value = {"content": [{"sample": "data"}]}
+        with fast_patch(hr_agent, "mcp", mcp_stub):
+            response = hr_agent.process_hr_query(query)
 
-                response = hr_agent.process_hr_query(query)
+            # Should have retrieved data
+            assert mcp_stub.called
 
-                # Should have retrieved data
-                mock_mcp.call_tool.assert_called()
-
-                # Should generate formatted response
-                assert isinstance(response, str)
-                assert len(response) > 0
+            # Should generate formatted response
+            assert isinstance(response, str)
+            assert len(response) > 0
 
-    def test_context_extraction_and_formatting(self):
+    @pytest.mark.parametrize("input_data,expected_type,expected_output", _EXTRACT_CASES)
+    def test_context_extraction_and_formatting(
+        self, hr_agent, input_data, expected_type, expected_output
+    ):
         """Test context extraction and intelligent formatting"""
-        hr_agent = HRAgentA2A()
-
-        # Test data extraction helper
-        test_data_formats = [
-            ({"content": [{"name": "John", "id": 1}]}, "list", [{"name": "John", "id": 1}]),
-            ({"error": "Database error"}, "list", None),
-            ([{"name": "Direct", "id": 2}], "list", [{"name": "Direct", "id": 2}]),
-            ({"content": {"summary": "data"}}, "dict", {"summary": "data"}),
-        ]
-
-        for input_data, expected_type, expected_output in test_data_formats:
-            result = hr_agent._extract_data_from_mcp_result(input_data, expected_type)
+        result = hr_agent._extract_data_from_mcp_result(input_data, expected_type)
 
-            if expected_output is None:
-                assert result is None or result == []
-            else:
-                assert result == expected_output
+        if expected_output is None:
+            assert result is None or result == []
+        else:
+            assert result == expected_output
 
-    def test_response_augmentation_with_data(self):
+    def test_response_augmentation_with_data(self, hr_agent):
         """Test response augmentation with retrieved data"""
-        hr_agent = HRAgentA2A()
-
         # Mock formatted employee list method
-        with patch.object(hr_agent, "_get_formatted_employee_list") as mock_format:
-            mock_format.return_value = (
-                "Employee List:\n• John Doe (Engineering)\n• Jane Smith (Marketing)"
-            )
-
+        mock_format = MagicMock(
+            return_value="Employee List:\n• John Doe (Engineering)\n• Jane Smith (Marketing)"
+        )
+        with fast_patch(hr_agent, "_get_formatted_employee_list", mock_format):
             response = hr_agent._get_formatted_employee_list()
 
             # Should return formatted, augmented response
@@ -229,58 +338,25 @@ class TestRAGCapabilities:
 class TestAIDecisionMakingInfrastructure:
     """Test AI-driven decision making infrastructure"""
 
-    def test_confidence_based_routing(self):
+    @pytest.mark.parametrize("query,expected_agent,min_confidence", CONFIDENCE_CASES)
+    def test_confidence_based_routing(self, main_agent, query, expected_agent, min_confidence):
         """Test confidence-based intelligent routing"""
-        main_agent = MainAgentA2A()
+        best_agent, confidence = main_agent.determine_best_agent_a2a(query)
 
-        # Test confidence calculation algorithm (updated for actual thresholds)
-        test_cases = [
-            # HR agent needs many keywords to meet 0.9 threshold
-            ("employee department salary payroll hierarchy team staff manager", "hr_agent", 0.9),
-            # Greeting agent keywords (updated for actual confidence levels)
-            ("hello how are you", "greeting_agent", 0.5),  # Falls back to 0.5 default
-            # Fallback for unclear queries
-            ("random unclear query xyz", "greeting_agent", 0.5),
-        ]
+        assert (
+            best_agent == expected_agent
+        ), f"Query '{query}' should route to {expected_agent}, got {best_agent}"
+        assert min_confidence <= confidence <= 1.0, query
 
-        for query, expected_agent, min_confidence in test_cases:
-            best_agent, confidence = main_agent.determine_best_agent_a2a(query)
+    @pytest.mark.parametrize("response,min_expected_score", QUALITY_CASES)
+    def test_quality_scoring_algorithm(self, orchestrator, response, min_expected_score):
+        """Test intelligent quality scoring algorithm"""
+        score = orchestrator._evaluate_result_quality(response)
 
-            assert (
-                best_agent == expected_agent
-            ), f"Query '{query}' should route to {expected_agent}, got {best_agent}"
-            assert confidence >= min_confidence
-            assert confidence <= 1.0
+        assert min_expected_score <= score <= 10.0
 
-    def test_quality_scoring_algorithm(self):
-        """Test intelligent quality scoring algorithm"""
-        orchestrator = MultiAgentOrchestrator()
-
-        # Test quality scoring with different response types (updated for actual algorithm)
-        test_responses = [
-            ("", 0.0),  # Empty response
-            ("Short response", 1.0),  # Basic response
-            (
-                {"structured": "data", "with": "multiple", "fields": True},
-                3.0,
-            ),  # Structured response (reduced expectation)
-            (
-                "This is a very detailed and comprehensive response with lots of information and context "
-                * 3,
-                4.5,
-            ),  # Detailed response (adjusted to match actual score)
-        ]
-
-        for response, min_expected_score in test_responses:
-            score = orchestrator._evaluate_result_quality(response)
-
-            assert score >= min_expected_score
-            assert 0.0 <= score <= 10.0
-
-    def test_competitive_decision_algorithm(self):
+    def test_competitive_decision_algorithm(self, orchestrator):
         """Test competitive decision-making algorithm"""
-        orchestrator = MultiAgentOrchestrator()
-
         # Test competitive selection logic
         agent_results = {
             "fast_agent": {"result": "Quick response", "execution_time": 0.5, "quality_score": 4.0},
@@ -301,145 +377,90 @@ class TestAIDecisionMakingInfrastructure:
         # Quality should generally win over speed
         assert winner == "quality_agent", "Quality agent should win in competitive scenario"
 
-    def test_consensus_decision_algorithm(self):
+    @pytest.mark.parametrize("agent_responses,acceptable", CONSENSUS_CASES)
+    def test_consensus_decision_algorithm(self, orchestrator, agent_responses, acceptable):
         """Test consensus-based decision making"""
-        orchestrator = MultiAgentOrchestrator()
+        consensus = orchestrator._determine_consensus(agent_responses)
+        assert consensus in acceptable, f"Consensus {consensus!r} not in {acceptable}"
 
-        # Test consensus with clear majority
-        responses_majority = {
-            "agent1": "Response A",
-            "agent2": "Response A",
-            "agent3": "Response B",
-            "agent4": "Response A",
+
+class TestContextualIntelligence:
+    """Test contextual intelligence and adaptive responses"""
+
+    def test_workflow_context_propagation(self):
+        """Test context is preserved and enhanced through workflow coordination"""
+        initial_context = {
+            "user_intent": "data_analysis",
+            "session_id": "test_session_123",
+            "priority": "high",
         }
+        enhanced_context = {**initial_context, "workflow_stage": "processing"}
 
-        consensus = orchestrator._determine_consensus(responses_majority)
-        assert consensus == "Response A", "Should choose majority response"
+        assert {"user_intent", "session_id", "workflow_stage"} <= enhanced_context.keys()
 
-        # Test consensus with tie (should pick one)
-        responses_tie = {"agent1": "Response X", "agent2": "Response Y"}
+    @pytest.mark.parametrize("agent_fixture", [name for name, _ in SPECIALIZATION_KEYWORDS])
+    def test_agent_identity(self, request, agent_fixture):
+        """Test agents are aware of their identity and specialization"""
+        agent = request.getfixturevalue(agent_fixture)
 
-        consensus = orchestrator._determine_consensus(responses_tie)
-        assert consensus in ["Response X", "Response Y"], "Should pick one of the tied responses"
+        assert getattr(agent, "agent_id", None) is not None
+        assert hasattr(agent, "specialization") or hasattr(agent, "agent_type")
 
+    @pytest.mark.parametrize("agent_fixture,expected_keywords", SPECIALIZATION_KEYWORDS)
+    def test_capabilities_match_specialization(
+        self, capability_keywords, agent_fixture, expected_keywords
+    ):
+        """Test agent capabilities align with their specialization"""
+        keywords = capability_keywords[agent_fixture]
+        if keywords is None:
+            pytest.skip(f"{agent_fixture} has no capabilities")
 
-class TestContextualIntelligence:
-    """Test contextual intelligence and adaptive responses"""
+        assert keywords & expected_keywords
 
-    def test_agent_specialization_awareness(self):
-        """Test agents are aware of their specializations"""
-        agents = [
-            (HRAgentA2A(), "hr_agent_specialist", ["employee", "hr", "organization"]),
-            (GreetingAgentA2A(), "greeting_agent_social", ["greeting", "social", "help"]),
-            (MainAgentA2A(), "main_agent_coordinator", ["coordination", "routing"]),
-        ]
-
-        for agent, expected_id, expected_keywords in agents:
-            assert hasattr(agent, "agent_id")
-            assert hasattr(agent, "specialization") or hasattr(agent, "agent_type")
-
-            if hasattr(agent, "capabilities"):
-                # Check that capabilities align with specialization
-                all_keywords = []
-                for cap in agent.capabilities:
-                    all_keywords.extend(cap.keywords)
-
-                # Should have some overlap with expected keywords
-                overlap = set(all_keywords) & set(expected_keywords)
-                assert len(overlap) > 0, f"Agent capabilities should align with specialization"
-
-    def test_cross_agent_referral_intelligence(self):
+    def test_cross_agent_referral_intelligence(self, greeting_agent):
         """Test intelligent cross-agent referrals"""
-        greeting_agent = GreetingAgentA2A()
-
         # Test that greeting agent provides intelligent referrals
-        help_response = greeting_agent._handle_help_request()
+        help_response = greeting_agent._handle_help_request().lower()
 
         # Should mention other agents and their capabilities
-        agent_references = ["HR", "MainAgent", "agent", "employee", "data"]
-        found_references = sum(
-            1 for ref in agent_references if ref.lower() in help_response.lower()
-        )
+        found_references = sum(ref in help_response for ref in AGENT_REFERENCES)
 
         assert (
             found_references >= 2
         ), "Help response should reference other agents and their capabilities"
 
-    def test_workflow_context_propagation(self):
-        """Test context propagation in workflow coordination"""
-        orchestrator = MultiAgentOrchestrator()
-
-        # Test that context is properly structured for propagation
-        initial_context = {
-            "user_intent": "data_analysis",
-            "session_id": "test_session_123",
-            "priority": "high",
-        }
-
-        # Context should be preserved and enhanced through workflow
-        enhanced_context = {**initial_context, "workflow_stage": "processing"}
-
-        # Validate context structure
-        assert "user_intent" in enhanced_context
-        assert "session_id" in enhanced_context
-        assert "workflow_stage" in enhanced_context
-
 
 class TestAdaptiveResponseGeneration:
     """Test adaptive and personalized response generation"""
 
-    def test_personality_consistency(self):
+    @pytest.mark.parametrize("query", PERSONALITY_QUERIES)
+    def test_personality_consistency(self, social_responses, query):
         """Test consistent personality in agent responses"""
-        greeting_agent = GreetingAgentA2A()
-
-        # Test multiple interactions for personality consistency
-        interactions = ["Hello", "How are you?", "Thank you", "Who are you?"]
-
-        responses = [greeting_agent.process_social_query(query) for query in interactions]
-
-        # Check for basic consistent tone (adjusted for actual implementation)
-        consistent_elements = ["Hello", "help", "assist", "!", "?", "greeting"]
+        response = social_responses[query]
 
-        for response in responses:
-            # Ensure responses are non-empty and contain basic greeting elements
-            assert len(response) > 0, f"Response should not be empty: {response}"
-            # Check for at least some consistent greeting behavior
-            has_greeting_behavior = any(
-                element.lower() in response.lower() for element in consistent_elements
-            )
-            assert (
-                has_greeting_behavior
-            ), f"Response should maintain basic greeting behavior: {response[:100]}"
+        # Ensure responses are non-empty and contain basic greeting elements
+        assert len(response) > 0, f"Response should not be empty: {response}"
+        # Check for at least some consistent greeting behavior
+        # (adjusted for actual implementation)
+        has_greeting_behavior = bool(_GREETING_RE.search(response))
+        assert (
+            has_greeting_behavior
+        ), f"Response should maintain basic greeting behavior: {response[:100]}"
 
-    def test_response_richness_and_guidance(self):
+    def test_response_richness_and_guidance(self, hr_agent):
         """Test response richness and user guidance"""
-        hr_agent = HRAgentA2A()
-
         # Test that responses provide basic information and guidance
-        with patch.object(hr_agent, "mcp") as mock_mcp:
-            mock_mcp.call_tool.return_value = {"content": []}
-
+        with fast_patch(hr_agent, "mcp", _McpStub({"content": []})):
             smart_search_response = hr_agent._smart_search("unknown query")
 
             # Should provide basic helpful response (adjusted expectations)
             assert len(smart_search_response) > 10  # Basic response
 
             # Check for basic guidance elements
-            guidance_elements = [
-                "try",
-                "ask",
-                "help",
-                "search",
-                "find",
-                "information",
-                "employee",
-                "department",
-            ]
-            has_guidance = any(
-                element in smart_search_response.lower() for element in guidance_elements
-            )
+            has_guidance = bool(_SEARCH_GUIDANCE_RE.search(smart_search_response))
             assert has_guidance, f"Should provide basic guidance: {smart_search_response[:100]}"
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
+    # loadscope keeps each test class on one worker so module fixtures are not rebuilt per test
+    pytest.main([__file__, "-v", "--tb=short", "-n", "auto", "--dist=loadscope"])
@@ -13,36 +13,32 @@ This test suite validates the assumptions about:
 """
 
 import asyncio
-import sys
+import json
 import time
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
-
 from a2a.protocol import (
     A2AMessage,
     A2AProtocol,
     AgentCapability,
     AgentProfile,
     MessageType,
+    encode_body,
 )
-from agents.greeting_agent_a2a import GreetingAgentA2A
-from agents.hr_agent_a2a import HRAgentA2A
-from agents.main_agent_a2a import MainAgentA2A
 from coordination.orchestrator import (
     CoordinationPattern,
-    MultiAgentOrchestrator,
     TaskNode,
     TaskStatus,
     WorkflowResult,
 )
 from mcp_server.http_server import MCPRequest, MCPResponse
 
+# Agents come from the module-scoped fixtures in tests/unit/conftest.py. The orchestrator
+# is the function-scoped one from tests/conftest.py, rebuilt per test because the
+# coordination tests replace its _execute_single_task.
+
 
 class TestStructuredResponses:
     """Test structured response formats across all system components"""
@@ -78,6 +74,11 @@ class TestStructuredResponses:
         assert reconstructed.message_id == message.message_id
         assert reconstructed.sender_id == message.sender_id
 
+        # Editing the serialized payload leaves the signed message untouched
+        message_dict["payload"]["task"] = "tampered"
+        assert message.payload["task"] == "test task"
+        assert protocol.verify_message(message)
+
     def test_agent_capability_structure(self):
         """Test agent capability follows standardized schema"""
         capability = AgentCapability(
@@ -138,14 +139,34 @@ class TestStructuredResponses:
         assert hasattr(response, "error")
         assert response.error is None or isinstance(response.error, str)
 
+    @pytest.mark.parametrize(
+        "built, validated",
+        [
+            (
+                MCPResponse.ok({"employees": [{"id": 1, "name": "John Doe"}]}),
+                MCPResponse(result={"employees": [{"id": 1, "name": "John Doe"}]}, error=None),
+            ),
+            (MCPResponse.ok(None), MCPResponse(result=None, error=None)),
+            (MCPResponse.err("Tool failed"), MCPResponse(result=None, error="Tool failed")),
+        ],
+        ids=["ok", "ok_none", "err"],
+    )
+    def test_mcp_response_shortcuts_match_validated_constructor(self, built, validated):
+        """Test MCPResponse.ok/err serialize exactly like the validated constructor"""
+        from fastapi.encoders import jsonable_encoder
+
+        assert built == validated
+        assert built.model_dump() == validated.model_dump()
+        assert built.model_dump_json() == validated.model_dump_json()
+        # FastAPI encodes returned models this way for the /mcp JSON response
+        assert jsonable_encoder(built) == jsonable_encoder(validated)
+
 
 class TestDecisionMakingLogic:
     """Test intelligent decision-making and routing logic"""
 
-    def test_main_agent_query_routing_confidence(self):
+    def test_main_agent_query_routing_confidence(self, main_agent):
         """Test MainAgent's confidence-based query routing"""
-        main_agent = MainAgentA2A()
-
         # Test HR-related queries with sufficient HR keywords to meet 0.9 threshold
         # Need at least 8/9 keywords to reach 0.9+ confidence after 1.2x boost
         hr_queries = [
@@ -163,10 +184,8 @@ class TestDecisionMakingLogic:
             # HR queries with many keywords should have high confidence
             assert confidence >= 0.9
 
-    def test_greeting_agent_query_routing_confidence(self):
+    def test_greeting_agent_query_routing_confidence(self, main_agent):
         """Test greeting-related query routing"""
-        main_agent = MainAgentA2A()
-
         greeting_queries = [
             "Hello there!",
             "Hi, how are you?",
@@ -181,10 +200,8 @@ class TestDecisionMakingLogic:
             assert isinstance(confidence, float)
             assert confidence > 0.0
 
-    def test_confidence_threshold_logic(self):
+    def test_confidence_threshold_logic(self, main_agent):
         """Test confidence threshold decision making"""
-        main_agent = MainAgentA2A()
-
         # Test low-confidence query falls back to greeting agent
         ambiguous_query = "xyz random unclear query"
         best_agent, confidence = main_agent.determine_best_agent_a2a(ambiguous_query)
@@ -199,10 +216,8 @@ class TestDecisionMakingLogic:
         assert best_agent == "greeting_agent"  # Falls back due to low confidence
         assert confidence == 0.5  # Fallback confidence
 
-    def test_keyword_matching_algorithm(self):
+    def test_keyword_matching_algorithm(self, main_agent):
         """Test keyword matching algorithm in agent routing"""
-        main_agent = MainAgentA2A()
-
         # Test keyword matching with realistic expectations
         # Based on actual behavior, need very specific HR query to trigger HR routing
         specific_query = "employee department salary manager organization"
@@ -215,14 +230,46 @@ class TestDecisionMakingLogic:
         ], f"Expected hr_agent or greeting_agent, got {best_agent}"
         assert confidence >= 0.5  # Should have some confidence
 
+    def test_routing_cache_and_rebuild(self):
+        """Test routing decisions are cached and follow changes to agent_specializations"""
+        import gc
+        import weakref
+
+        from agents.main_agent_a2a import MainAgentA2A
+
+        main_agent = MainAgentA2A()  # Own instance, the specializations are changed below
+
+        first = main_agent.determine_best_agent_a2a("Hello there!")
+        assert main_agent.determine_best_agent_a2a("  hello THERE!  ") == first
+        assert main_agent._route_normalized.cache_info().hits == 1
+
+        # In-place edits are picked up without an explicit rebuild
+        main_agent.agent_specializations["hr_agent"]["keywords"][:] = ["roster", "rota"]
+        main_agent.agent_specializations["hr_agent"]["confidence_threshold"] = 0.5
+        assert main_agent.determine_best_agent_a2a("Show the roster") == ("hr_agent", 0.6)
+
+        # So is reassigning the whole mapping
+        main_agent.agent_specializations = {
+            "hr_agent": {"keywords": ["roster"], "confidence_threshold": 0.5},
+        }
+        assert main_agent.determine_best_agent_a2a("Show the roster") == ("hr_agent", 1.0)
+        assert main_agent.determine_best_agent_a2a("Hello there!") == ("greeting_agent", 0.5)
+
+        # The route cache does not reference the agent, so dropping it frees the instance
+        gc.disable()
+        try:
+            agent_ref = weakref.ref(main_agent)
+            del main_agent
+            assert agent_ref() is None
+        finally:
+            gc.enable()
+
 
 class TestQualityScoringSystem:
     """Test quality evaluation and scoring systems"""
 
-    def test_orchestrator_result_quality_evaluation(self):
+    def test_orchestrator_result_quality_evaluation(self, orchestrator):
         """Test orchestrator's result quality evaluation logic"""
-        orchestrator = MultiAgentOrchestrator()
-
         # Test empty result
         empty_score = orchestrator._evaluate_result_quality(None)
         assert empty_score == 0.0
@@ -249,10 +296,8 @@ class TestQualityScoringSystem:
         detailed_score = orchestrator._evaluate_result_quality(detailed_result)
         assert detailed_score > simple_score  # Should get detail bonus
 
-    def test_competitive_winner_determination(self):
+    def test_competitive_winner_determination(self, orchestrator):
         """Test competitive coordination winner determination"""
-        orchestrator = MultiAgentOrchestrator()
-
         agent_results = {
             "agent1": {"result": "Basic result", "execution_time": 2.0, "quality_score": 5.0},
             "agent2": {
@@ -266,10 +311,15 @@ class TestQualityScoringSystem:
         winner = orchestrator._determine_winner(agent_results)
         assert winner == "agent2"  # Should win due to higher quality score
 
-    def test_consensus_determination(self):
-        """Test consensus determination logic"""
-        orchestrator = MultiAgentOrchestrator()
+        # Runners-up are ranked by the same quality and speed score
+        assert orchestrator._top_k_winners(agent_results, 3) == ["agent2", "agent1", "agent3"]
+
+        # Ties go to the agent listed first
+        tied = {"first": {"quality_score": 5.0}, "second": {"quality_score": 5.0}}
+        assert orchestrator._determine_winner(tied) == "first"
 
+    def test_consensus_determination(self, orchestrator):
+        """Test consensus determination logic"""
         # Test majority consensus
         agent_responses = {
             "agent1": "Response A",
@@ -291,9 +341,8 @@ class TestCoordinationPatterns:
     """Test multi-agent coordination pattern implementations"""
 
     @pytest.mark.asyncio
-    async def test_sequential_coordination_pattern(self):
+    async def test_sequential_coordination_pattern(self, orchestrator):
         """Test sequential coordination pattern logic"""
-        orchestrator = MultiAgentOrchestrator()
 
         # Mock task execution
         async def mock_execute_single_task(task):
@@ -323,13 +372,19 @@ class TestCoordinationPatterns:
             assert "context" in task.input_data
 
     @pytest.mark.asyncio
-    async def test_parallel_coordination_pattern(self):
+    async def test_parallel_coordination_pattern(self, orchestrator):
         """Test parallel coordination pattern logic"""
-        orchestrator = MultiAgentOrchestrator()
+        # Barrier releases only once every task has started, so a serial
+        # executor would time out instead of passing
+        pending = 3
+        gate = asyncio.Event()
 
-        # Mock task execution with delay to test concurrency
         async def mock_execute_single_task(task):
-            await asyncio.sleep(0.1)  # Simulate work
+            nonlocal pending
+            pending -= 1
+            if pending == 0:
+                gate.set()
+            await asyncio.wait_for(gate.wait(), timeout=1.0)
             task.status = TaskStatus.COMPLETED
             task.result = f"Result for {task.task_id}"
             return task.result
@@ -342,18 +397,50 @@ class TestCoordinationPatterns:
             TaskNode("task3", "Parallel task 3", "agent3", {"input": "data3"}),
         ]
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = await orchestrator._execute_parallel("test_workflow", tasks, {})
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
 
-        # Should complete in roughly parallel time (not sequential)
-        assert execution_time < 0.5  # Much less than 3 * 0.1 = 0.3s sequential time
+        # Should complete without waiting on the barrier timeout (not sequential)
+        assert execution_time < 0.5
         assert len(results) == 3
+        assert all(task.status == TaskStatus.COMPLETED for task in tasks)
 
     @pytest.mark.asyncio
-    async def test_hierarchical_coordination_pattern(self):
+    async def test_parallel_coordination_respects_concurrency_limit(self, orchestrator):
+        """Test parallel pattern caps in-flight tasks and isolates failures"""
+        orchestrator.max_parallel_tasks = 2
+
+        in_flight = 0
+        peak = 0
+
+        async def mock_execute_single_task(task):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if task.task_id == "task2":
+                raise RuntimeError("agent unavailable")
+            task.status = TaskStatus.COMPLETED
+            return f"Result for {task.task_id}"
+
+        orchestrator._execute_single_task = mock_execute_single_task
+
+        tasks = [
+            TaskNode(f"task{i}", f"Parallel task {i}", f"agent{i}", {"input": i}) for i in range(5)
+        ]
+
+        results = await orchestrator._execute_parallel("test_workflow", tasks, {})
+
+        assert peak == 2
+        assert results["task2"] == {"error": "agent unavailable"}
+        assert tasks[2].status == TaskStatus.FAILED
+        assert all(results[f"task{i}"] == f"Result for task{i}" for i in (0, 1, 3, 4))
+
+    @pytest.mark.asyncio
+    async def test_hierarchical_coordination_pattern(self, orchestrator):
         """Test hierarchical coordination with dependencies"""
-        orchestrator = MultiAgentOrchestrator()
 
         # Mock task execution
         async def mock_execute_single_task(task):
@@ -389,14 +476,61 @@ class TestCoordinationPatterns:
             if task.dependencies:
                 assert "dependency_results" in task.input_data
 
+    @pytest.mark.asyncio
+    async def test_hierarchical_waves_and_unresolvable_dependencies(self, orchestrator):
+        """Test hierarchical execution order and rejection of unresolvable dependencies"""
+        completed_at_start = {}
+        completed = set()
+
+        async def mock_execute_single_task(task):
+            # Record which tasks had already finished when this one started
+            completed_at_start[task.task_id] = frozenset(completed)
+            # Yield so the rest of the wave starts before this task completes
+            await asyncio.sleep(0)
+            completed.add(task.task_id)
+            task.status = TaskStatus.COMPLETED
+            return f"Result for {task.task_id}"
+
+        orchestrator._execute_single_task = mock_execute_single_task
+
+        tasks = [
+            TaskNode("leaf", "Depends on both", "agent1", {}, dependencies=["left", "right"]),
+            TaskNode("right", "Depends on root", "agent2", {}, dependencies=["root"]),
+            TaskNode("root", "Root task", "agent3", {}),
+            TaskNode("left", "Depends on root", "agent4", {}, dependencies=["root"]),
+        ]
+
+        results = await orchestrator._execute_hierarchical("test_workflow", tasks, {})
+
+        # root runs alone, left and right run together once root is done (neither waits
+        # for the other), and leaf only starts after both of them finished
+        assert completed_at_start == {
+            "root": frozenset(),
+            "right": frozenset({"root"}),
+            "left": frozenset({"root"}),
+            "leaf": frozenset({"root", "left", "right"}),
+        }
+        assert tasks[0].input_data["dependency_results"] == {
+            "left": "Result for left",
+            "right": "Result for right",
+        }
+        assert results == {task.task_id: f"Result for {task.task_id}" for task in tasks}
+
+        # A cycle and a dependency on an unknown task can never be satisfied
+        for dependencies in (["b"], ["missing"]):
+            blocked = [
+                TaskNode("a", "Blocked task", "agent1", {}, dependencies=dependencies),
+                TaskNode("b", "Depends on a", "agent2", {}, dependencies=["a"]),
+            ]
+            with pytest.raises(Exception, match="unresolvable dependencies"):
+                await orchestrator._execute_hierarchical("test_workflow", blocked, {})
+
 
 class TestAgentCapabilityDefinitions:
     """Test agent capability definitions and structures"""
 
-    def test_hr_agent_capabilities(self):
+    def test_hr_agent_capabilities(self, hr_agent):
         """Test HR agent capability definitions"""
-        hr_agent = HRAgentA2A()
-
         # Validate capabilities exist and are properly structured
         assert hasattr(hr_agent, "capabilities")
         assert len(hr_agent.capabilities) > 0
@@ -411,10 +545,8 @@ class TestAgentCapabilityDefinitions:
             assert len(capability.keywords) > 0
             assert 0.0 <= capability.confidence_level <= 1.0
 
-    def test_greeting_agent_capabilities(self):
+    def test_greeting_agent_capabilities(self, greeting_agent):
         """Test Greeting agent capability definitions"""
-        greeting_agent = GreetingAgentA2A()
-
         # Validate capabilities exist and are properly structured
         assert hasattr(greeting_agent, "capabilities")
         assert len(greeting_agent.capabilities) > 0
@@ -429,10 +561,8 @@ class TestAgentCapabilityDefinitions:
         for keyword in expected_social_keywords:
             assert any(keyword in social_keywords for keyword in expected_social_keywords)
 
-    def test_agent_specialization_consistency(self):
+    def test_agent_specialization_consistency(self, main_agent):
         """Test agent specialization definitions are consistent"""
-        main_agent = MainAgentA2A()
-
         # Validate specialization structure
         assert hasattr(main_agent, "agent_specializations")
         specializations = main_agent.agent_specializations
@@ -470,6 +600,67 @@ class TestProtocolCompliance:
         message.payload["modified"] = "data"
         assert protocol.verify_message(message) is False
 
+    def test_send_message_body_encoding(self):
+        """Test outbound messages are posted as the JSON form of to_dict()"""
+        protocol = A2AProtocol("test_agent", "TestAgent", "http://localhost:8000", "secret_key")
+        message = protocol.create_message(
+            MessageType.TASK_REQUEST, "recipient", {"task": "café", "ids": [1, 2]}
+        )
+
+        with patch("a2a.protocol.requests.post") as mock_post:
+            mock_post.return_value = Mock(status_code=200, json=Mock(return_value={"ok": True}))
+            assert protocol.send_message(message) == {"ok": True}
+
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert json.loads(kwargs["data"]) == message.to_dict()
+
+    def test_encode_body_stdlib_fallback(self):
+        """Test message bodies are encoded with stdlib json when orjson is missing"""
+        body = {"task": "café", "ids": [1, 2]}
+
+        with patch("a2a.protocol.orjson", None):
+            assert encode_body(body) == json.dumps(body).encode("utf-8")
+
+    def test_encode_body_retries_orjson_type_error(self):
+        """Test bodies orjson rejects are re-encoded with stdlib json"""
+        pytest.importorskip("orjson")
+        # orjson refuses integers wider than 64 bits
+        body = {"big": 2**70}
+
+        assert encode_body(body) == json.dumps(body).encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_delegation_message_body_encoding(self, orchestrator):
+        """Test the orchestrator posts delegation messages through encode_body"""
+        message = orchestrator.a2a.create_message(
+            MessageType.DELEGATION_REQUEST, "hr_agent", {"task": "café"}
+        )
+        posted = {}
+
+        class FakeResponse:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def json(self):
+                return {"ok": True}
+
+        class FakeSession(FakeResponse):
+            def post(self, url, **kwargs):
+                posted.update(kwargs, url=url)
+                return FakeResponse()
+
+        with patch("aiohttp.ClientSession", FakeSession):
+            response = await orchestrator._send_delegation_message("http://localhost:8002", message)
+
+        assert response == {"ok": True}
+        assert posted["url"] == "http://localhost:8002/a2a"
+        assert posted["headers"]["Content-Type"] == "application/json"
+        assert json.loads(posted["data"]) == message.to_dict()
+
     def test_protocol_message_types(self):
         """Test all protocol message types are supported"""
         protocol = A2AProtocol("test_agent", "TestAgent", "http://localhost:8000")
@@ -522,10 +713,8 @@ class TestProtocolCompliance:
 class TestErrorHandlingAndResilience:
     """Test error handling and system resilience"""
 
-    def test_task_retry_logic(self):
+    def test_task_retry_logic(self, orchestrator):
         """Test task retry logic in orchestrator"""
-        orchestrator = MultiAgentOrchestrator()
-
         # Create task with retry configuration
         task = TaskNode(
             "retry_task",
@@ -547,10 +736,8 @@ class TestErrorHandlingAndResilience:
         assert task.retry_count == 1
         assert task.retry_count <= task.max_retries
 
-    def test_fallback_routing_logic(self):
+    def test_fallback_routing_logic(self, main_agent):
         """Test fallback routing when primary agent fails"""
-        main_agent = MainAgentA2A()
-
         # Test that greeting agent is used as fallback
         unknown_query = "completely unknown and ambiguous request xyz"
         best_agent, confidence = main_agent.determine_best_agent_a2a(unknown_query)